@@ -2,7 +2,7 @@
 Define an entry point wrapper for pytest.
 """
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 import click
 
@@ -10,29 +10,42 @@ from ethereum_test_tools import Macro
 from ethereum_test_tools import Opcodes as Op
 
 
+def _opcodes_by_byte() -> Tuple[Optional[Op], ...]:
+    """
+    Returns a table indexed by byte value that contains the first opcode in `Op` encoded as that
+    byte, or `None` if there is no such opcode.
+    """
+    opcodes: List[Optional[Op]] = [None] * 256
+    for op in Op:
+        if not isinstance(op, Macro) and opcodes[op.int()] is None:
+            opcodes[op.int()] = op
+    return tuple(opcodes)
+
+
+OPCODES_BY_BYTE = _opcodes_by_byte()
+
+
 def process_evm_bytes(evm_bytes_hex_string: Any) -> str:  # noqa: D103
     if evm_bytes_hex_string.startswith("0x"):
         evm_bytes_hex_string = evm_bytes_hex_string[2:]
 
-    evm_bytes = bytearray(bytes.fromhex(evm_bytes_hex_string))
+    evm_bytes = bytes.fromhex(evm_bytes_hex_string)
 
     opcodes_strings: List[str] = []
 
-    while evm_bytes:
-        opcode_byte = evm_bytes.pop(0)
-
-        opcode: Optional[Op] = None
-        for op in Op:
-            if not isinstance(op, Macro) and op.int() == opcode_byte:
-                opcode = op
-                break
+    # Walk the bytes by index: popping from the front of the buffer shifts every remaining byte.
+    index = 0
+    while index < len(evm_bytes):
+        opcode_byte = evm_bytes[index]
+        index += 1
 
+        opcode = OPCODES_BY_BYTE[opcode_byte]
         if opcode is None:
             raise ValueError(f"Unknown opcode: {opcode_byte}")
 
         if opcode.data_portion_length > 0:
-            data_portion = evm_bytes[: opcode.data_portion_length]
-            evm_bytes = evm_bytes[opcode.data_portion_length :]
+            data_portion = evm_bytes[index : index + opcode.data_portion_length]
+            index += opcode.data_portion_length
             opcodes_strings.append(f'Op.{opcode._name_}("0x{data_portion.hex()}")')
         else:
             opcodes_strings.append(f"Op.{opcode._name_}")
@@ -255,7 +255,7 @@ class Section(CopyValidateModel):
         if sections[0].kind not in SUPPORT_MULTI_SECTION_HEADER:
             return b"".join(s.header for s in sections)
 
-        h = sections[0].kind.to_bytes(HEADER_SECTION_KIND_BYTE_LENGTH, "big")
+        h = bytearray(sections[0].kind.to_bytes(HEADER_SECTION_KIND_BYTE_LENGTH, "big"))
 
         # Count only those sections that are not marked to be skipped for header calculation
         header_registered_sections = 0
@@ -271,7 +271,7 @@ class Section(CopyValidateModel):
             size = cs.custom_size if "custom_size" in cs.model_fields_set else len(cs.data)
             h += size.to_bytes(HEADER_SECTION_SIZE_BYTE_LENGTH, "big")
 
-        return h
+        return bytes(h)
 
     @classmethod
     def Code(  # noqa: N802
@@ -379,7 +379,10 @@ class Container(CopyValidateModel):
             assert len(self.sections) == 0
             return self.raw_bytes
 
-        c = self.magic + self.version
+        # Write everything into a single buffer instead of re-allocating an immutable `bytes`
+        # object on every append.
+        c = bytearray(self.magic)
+        c += self.version
 
         # Prepare auto-generated sections
         sections = self.sections
@@ -388,16 +391,19 @@ class Container(CopyValidateModel):
         if self.auto_type_section.any() and count_sections(sections, SectionKind.TYPE) == 0:
             # Calculate skipping flags
             types_header_size = 0
-            type_section_data = b""
+            type_section_data = bytearray()
             for s in sections:
                 types_header_size += (
                     len(s.type_definition) if not s.skip_types_header_listing else 0
                 )
-                type_section_data += s.type_definition if not s.skip_types_body_listing else b""
+                if not s.skip_types_body_listing:
+                    type_section_data += s.type_definition
 
             sections = [
                 Section(
-                    kind=SectionKind.TYPE, data=type_section_data, custom_size=types_header_size
+                    kind=SectionKind.TYPE,
+                    data=bytes(type_section_data),
+                    custom_size=types_header_size,
                 )
             ] + sections
 
@@ -422,7 +428,8 @@ class Container(CopyValidateModel):
                     concurrent_sections[-1].append(s)
                 else:
                     concurrent_sections.append([s])
-            c += b"".join(Section.list_header(cs) for cs in concurrent_sections)
+            for cs in concurrent_sections:
+                c += Section.list_header(cs)
 
         # Add header terminator
         c += self.header_terminator
@@ -442,7 +449,7 @@ class Container(CopyValidateModel):
         # Add extra (garbage)
         c += self.extra
 
-        return c
+        return bytes(c)
 
     @classmethod
     def Code(cls, code: BytesConvertible = Bytecode(), **kwargs) -> "Container":  # noqa: N802
@@ -528,6 +535,23 @@ def count_sections(sections: List[Section], kind: SectionKind | int) -> int:
 
 OPCODE_MAP: Dict[int, Op] = {x.int(): x for x in Op}
 
+_OPCODE_STACK_INFO: Tuple[Optional[Tuple[int, int, int]], ...] = tuple(
+    (
+        (
+            OPCODE_MAP[opcode_byte].data_portion_length,
+            OPCODE_MAP[opcode_byte].popped_stack_items,
+            OPCODE_MAP[opcode_byte].pushed_stack_items,
+        )
+        if opcode_byte in OPCODE_MAP
+        else None
+    )
+    for opcode_byte in range(256)
+)
+"""
+`(data_portion_length, popped_stack_items, pushed_stack_items)` of each opcode, indexed by the
+opcode byte, or `None` if the byte is not a known opcode.
+"""
+
 
 def compute_code_stack_values(code: bytes) -> Tuple[int, int, int]:
     """
@@ -541,23 +565,34 @@ def compute_code_stack_values(code: bytes) -> Tuple[int, int, int]:
     min_stack_height = 0
     max_stack_height = 0
 
+    # Bind values that are constant during the scan to locals, to avoid global and attribute
+    # look-ups on every instruction
+    code_length = len(code)
+    opcode_stack_info = _OPCODE_STACK_INFO
+    rjumpv = Op.RJUMPV.int()
+
     # compute type annotation
-    while i < len(code):
-        op = OPCODE_MAP.get(code[i])
-        if op is None:
+    while i < code_length:
+        opcode_byte = code[i]
+        op_info = opcode_stack_info[opcode_byte]
+        if op_info is None:
             return (0, 0, 0)
-        elif op == Op.RJUMPV:
+        data_portion_length, popped_stack_items, pushed_stack_items = op_info
+        if opcode_byte == rjumpv:
             i += 1
-            if i < len(code):
+            if i < code_length:
                 count = code[i]
                 i += count * 2
         else:
-            i += 1 + op.data_portion_length
-
-        stack_height -= op.popped_stack_items
-        min_stack_height = min(stack_height, min_stack_height)
-        stack_height += op.pushed_stack_items
-        max_stack_height = max(stack_height, max_stack_height)
+            i += 1 + data_portion_length
+
+        # Plain comparisons instead of `min`/`max` builtin calls on every instruction
+        stack_height -= popped_stack_items
+        if stack_height < min_stack_height:
+            min_stack_height = stack_height
+        stack_height += pushed_stack_items
+        if stack_height > max_stack_height:
+            max_stack_height = stack_height
     if stack_height < 0:
         stack_height = 0
     return (abs(min_stack_height), stack_height, max_stack_height)
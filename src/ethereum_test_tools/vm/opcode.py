@@ -8,7 +8,8 @@ to @ThreeHrSleep for integrating it in the docstrings.
 """
 
 from enum import Enum
-from typing import Any, Callable, Iterable, List, Mapping, Optional, SupportsBytes
+from struct import pack
+from typing import Any, Callable, Iterable, List, Mapping, Optional, SupportsBytes, Tuple
 
 from ethereum.crypto.hash import keccak256
 
@@ -23,11 +24,25 @@ def _get_int_size(n: int) -> int:
     if n < 0:
         # Negative numbers in the EVM are represented as two's complement of 32 bytes
         return 32
-    byte_count = 0
-    while n:
-        byte_count += 1
-        n >>= 8
-    return byte_count
+    return (n.bit_length() + 7) // 8
+
+
+def _combine_stack_values(
+    a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]
+) -> Tuple[int, int, int, int]:
+    """
+    Returns the popped, pushed, min and max stack height values of the bytecode that results from
+    executing bytecode `a` followed by bytecode `b`.
+    """
+    a_pop, a_push, a_min, a_max = a
+    b_pop, b_push, b_min, b_max = b
+    a_out = a_min - a_pop + a_push
+
+    c_pop = max(0, a_pop + (b_pop - a_push))
+    c_push = max(0, a_push + b_push - b_pop)
+    c_min = a_min if a_out >= b_min else (b_min - a_out) + a_min
+    c_max = max(a_max + max(0, b_min - a_out), b_max + max(0, a_out - b_min))
+    return c_pop, c_push, c_min, c_max
 
 
 class Bytecode:
@@ -161,16 +176,9 @@ class Bytecode:
             return self
         assert isinstance(other, Bytecode), "Can only concatenate Bytecode instances"
         # Figure out the stack height after executing the two opcodes.
-        a_pop, a_push = self.popped_stack_items, self.pushed_stack_items
-        a_min, a_max = self.min_stack_height, self.max_stack_height
-        b_pop, b_push = other.popped_stack_items, other.pushed_stack_items
-        b_min, b_max = other.min_stack_height, other.max_stack_height
-        a_out = a_min - a_pop + a_push
-
-        c_pop = max(0, a_pop + (b_pop - a_push))
-        c_push = max(0, a_push + b_push - b_pop)
-        c_min = a_min if a_out >= b_min else (b_min - a_out) + a_min
-        c_max = max(a_max + max(0, b_min - a_out), b_max + max(0, a_out - b_min))
+        c_pop, c_push, c_min, c_max = _combine_stack_values(
+            self._stack_values(), other._stack_values()
+        )
 
         return Bytecode(
             bytes(self) + bytes(other),
@@ -198,10 +206,22 @@ class Bytecode:
             raise ValueError("Cannot multiply by a negative number")
         if other == 0:
             return Bytecode()
-        output = self
+        if other == 1:
+            return self
+        # Only the stack values need to be folded one repetition at a time, the bytes can be
+        # repeated at once instead of re-allocating a growing bytes object on each iteration.
+        self_stack_values = self._stack_values()
+        stack_values = self_stack_values
         for _ in range(other - 1):
-            output += self
-        return output
+            stack_values = _combine_stack_values(stack_values, self_stack_values)
+        c_pop, c_push, c_min, c_max = stack_values
+        return Bytecode(
+            bytes(self) * other,
+            popped_stack_items=c_pop,
+            pushed_stack_items=c_push,
+            min_stack_height=c_min,
+            max_stack_height=c_max,
+        )
 
     def __call__(
         self,
@@ -289,6 +309,17 @@ class Bytecode:
             return pre_opcode_bytecode + self
         return self
 
+    def _stack_values(self) -> Tuple[int, int, int, int]:
+        """
+        Return the popped, pushed, min and max stack height values of the bytecode.
+        """
+        return (
+            self.popped_stack_items,
+            self.pushed_stack_items,
+            self.min_stack_height,
+            self.max_stack_height,
+        )
+
     def hex(self) -> str:
         """
         Return the hexadecimal representation of the opcode byte representation.
@@ -493,7 +524,8 @@ class Opcode(Bytecode):
         """
         Returns the integer representation of the opcode.
         """
-        return int.from_bytes(self, byteorder="big")
+        # Read the stored bytes directly rather than going through `__bytes__`
+        return int.from_bytes(self._bytes_, byteorder="big")
 
 
 class Macro(Bytecode):
@@ -531,27 +563,23 @@ RJUMPV_BRANCH_OFFSET_BYTE_LENGTH = 2
 # version.
 
 
+def _rjumpv_encode_table(max_index: int, branch_offsets: List[int]) -> bytes:
+    """
+    Packs the RJUMPV max index byte followed by the signed big-endian branch offsets in a single
+    call, instead of allocating an intermediate bytes object per table entry.
+    """
+    # `B` and `h` match RJUMPV_MAX_INDEX_BYTE_LENGTH and RJUMPV_BRANCH_OFFSET_BYTE_LENGTH
+    return pack(f">B{len(branch_offsets)}h", max_index, *branch_offsets)
+
+
 def _rjumpv_encoder(*args: int | bytes | Iterable[int]) -> bytes:
     if len(args) == 1:
         if isinstance(args[0], bytes) or isinstance(args[0], SupportsBytes):
             return bytes(args[0])
         elif isinstance(args[0], Iterable):
             int_args = list(args[0])
-            return b"".join(
-                [(len(int_args) - 1).to_bytes(RJUMPV_MAX_INDEX_BYTE_LENGTH, "big")]
-                + [
-                    i.to_bytes(RJUMPV_BRANCH_OFFSET_BYTE_LENGTH, "big", signed=True)
-                    for i in int_args
-                ]
-            )
-    return b"".join(
-        [(len(args) - 1).to_bytes(RJUMPV_MAX_INDEX_BYTE_LENGTH, "big")]
-        + [
-            i.to_bytes(RJUMPV_BRANCH_OFFSET_BYTE_LENGTH, "big", signed=True)
-            for i in args
-            if isinstance(i, int)
-        ]
-    )
+            return _rjumpv_encode_table(len(int_args) - 1, int_args)
+    return _rjumpv_encode_table(len(args) - 1, [i for i in args if isinstance(i, int)])
 
 
 def _exchange_encoder(*args: int) -> bytes: